@@ -1,30 +1,20 @@
-import anthropic
-import os
-from dotenv import load_dotenv
 import base64
-
-load_dotenv()
-
-client = anthropic.Anthropic(
-    api_key=os.environ.get("ANTHROPIC_API_KEY")
+import io
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+from client_factory import (
+    MAX_TOKENS,
+    get_client,
+    output_budget,
+    precheck,
+    retry_transient
 )
+from util import atomic_write, cache_report, cached_system, echo
 
-def encode_image(image_path):
-    """Convert image to base64 for Claude API"""
-    with open(image_path, "rb") as image_file:
-        return base64.standard_b64encode(image_file.read()).decode("utf-8")
-
-def generate_briefing(oura_screenshot_path, training_log_path):
-    """Generate morning briefing from screenshots"""
-    
-    # Encode images
-    oura_image = encode_image(oura_screenshot_path)
-    training_image = encode_image(training_log_path)
-    
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=3000,
-        system="""You are Michael's Performance Optimization Analyst.
+# Static briefing template, sent as a prompt-cached prefix. Keep dates and
+# week numbers out of it so the cached bytes stay identical day to day.
+BRIEFING_SYSTEM_PROMPT = """You are Michael's Performance Optimization Analyst.
 
 Generate his daily training briefing in this EXACT format:
 
@@ -77,35 +67,81 @@ SYSTEM INSIGHT:
 [Current trajectory, predictions, confidence levels]
 ==============================================
 
-Extract ALL data from the screenshots. Be specific with numbers. Reference his training plan.""",
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "image/png",
-                            "data": oura_image
-                        }
-                    },
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "image/png",
-                            "data": training_image
-                        }
-                    },
-                    {
-                        "type": "text",
-                        "text": "Generate my morning training briefing from these screenshots. Today is Tuesday, January 07, 2026. Week 12 training cycle."
+Extract ALL data from the screenshots. Be specific with numbers. Reference his training plan."""
+
+# Claude's vision pipeline scales anything larger down to this edge length
+MAX_IMAGE_EDGE = 1568
+
+def encode_image(image_path):
+    """Convert screenshot to a downscaled JPEG, base64 encoded for Claude API"""
+    with Image.open(image_path) as image:
+        image = image.convert("RGB")
+        image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE))
+
+        encoded = io.BytesIO()
+        image.save(encoded, "JPEG", quality=85, optimize=True)
+
+    return base64.standard_b64encode(encoded.getvalue()).decode("ascii")
+
+@retry_transient
+def generate_briefing(oura_screenshot_path, training_log_path):
+    """Generate morning briefing from screenshots"""
+    
+    # Encode both screenshots at once; file reads and base64 release the GIL
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        oura_image, training_image = executor.map(
+            encode_image, [oura_screenshot_path, training_log_path]
+        )
+    
+    system = cached_system(BRIEFING_SYSTEM_PROMPT)
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": oura_image
                     }
-                ]
-            }
-        ]
-    )
+                },
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": training_image
+                    }
+                },
+                {
+                    "type": "text",
+                    "text": "Generate my morning training briefing from these screenshots. Today is Tuesday, January 07, 2026. Week 12 training cycle."
+                }
+            ]
+        }
+    ]
+    
+    # Count the prompt (template plus both images) before committing to it
+    input_tokens = precheck(system, messages)
+    print(f"📏 {input_tokens} input tokens")
+    
+    # Stream so the briefing starts printing before generation finishes
+    with get_client().messages.stream(
+        model="claude-sonnet-4-20250514",
+        max_tokens=output_budget(input_tokens, MAX_TOKENS["briefing_generator"]),
+        temperature=0.0,
+        top_p=1.0,
+        system=system,
+        messages=messages
+    ) as stream:
+        for text in stream.text_stream:
+            echo(text)
+
+        message = stream.get_final_message()
+
+    print()
+    print(cache_report(message.usage))
     
     return message.content[0].text
 
@@ -117,10 +153,7 @@ if __name__ == "__main__":
         "training_log.png"
     )
     
-    print(briefing)
-    
     # Save to file
-    with open("DAILY_BRIEFING.txt", "w") as f:
-        f.write(briefing)
+    atomic_write("DAILY_BRIEFING.txt", briefing)
     
     print("\n✅ Briefing saved to DAILY_BRIEFING.txt")
\ No newline at end of file
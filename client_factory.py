@@ -0,0 +1,119 @@
+import anthropic
+import httpx
+import os
+from dotenv import load_dotenv
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+
+# Keep TLS sessions alive so consecutive and concurrent calls reuse connections
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60
+)
+
+# HTTP-level retries for idempotent failures. The read timeout leaves room
+# for a full 4000-token response on the non-streaming concurrent path.
+MAX_RETRIES = 3
+TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+# Rate limits, overload/5xx and dropped connections are worth another try
+TRANSIENT_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APITimeoutError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError
+)
+
+def _report_retry(retry_state):
+    error = retry_state.outcome.exception()
+    print(f"\n⚠️  {type(error).__name__}, retrying (attempt {retry_state.attempt_number + 1})")
+
+# Wraps a whole API exchange, including consuming a stream, with backoff
+retry_transient = retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception_type(TRANSIENT_ERRORS),
+    before_sleep=_report_retry,
+    reraise=True
+)
+
+# Output ceilings for the standalone scripts; specialist agents carry theirs
+# in agents.yaml. A briefing finishes well under 1200 tokens and the smoke
+# test in a line.
+MAX_TOKENS = {
+    "briefing_generator": 1500,
+    "test_claude": 128,
+}
+
+# Sonnet 4's context window, and slack left for token-count drift
+CONTEXT_LIMIT = 200_000
+TOKEN_SAFETY_MARGIN = 1_000
+
+# Created on first use so importing a script has no side effects
+_client = None
+_aclient = None
+
+def _load_api_key():
+    """Read .env only if the API key isn't already in the environment"""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        load_dotenv()
+
+def get_client():
+    """Process-wide synchronous Anthropic client"""
+    global _client
+    if _client is None:
+        _load_api_key()
+        _client = anthropic.Anthropic(
+            max_retries=MAX_RETRIES,
+            timeout=TIMEOUT,
+            http_client=anthropic.DefaultHttpxClient(limits=HTTP_LIMITS)
+        )
+
+    return _client
+
+def get_aclient():
+    """Process-wide asynchronous Anthropic client"""
+    global _aclient
+    if _aclient is None:
+        _load_api_key()
+        _aclient = anthropic.AsyncAnthropic(
+            max_retries=MAX_RETRIES,
+            timeout=TIMEOUT,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=HTTP_LIMITS)
+        )
+
+    return _aclient
+
+def precheck(system, messages, model="claude-sonnet-4-20250514"):
+    """Count a request's input tokens before sending it"""
+    count = get_client().messages.count_tokens(
+        model=model,
+        system=system,
+        messages=messages
+    )
+    return count.input_tokens
+
+async def aprecheck(system, messages, model="claude-sonnet-4-20250514"):
+    """Async precheck for the concurrent runner"""
+    count = await get_aclient().messages.count_tokens(
+        model=model,
+        system=system,
+        messages=messages
+    )
+    return count.input_tokens
+
+def output_budget(input_tokens, max_tokens):
+    """Largest max_tokens that still fits in the context after the prompt"""
+    room = CONTEXT_LIMIT - input_tokens - TOKEN_SAFETY_MARGIN
+    if room <= 0:
+        raise ValueError(
+            f"Prompt is {input_tokens} tokens, leaving no room in the "
+            f"{CONTEXT_LIMIT}-token context window"
+        )
+
+    return min(max_tokens, room)
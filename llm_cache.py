@@ -0,0 +1,89 @@
+import hashlib
+import orjson
+import os
+
+from client_factory import aprecheck, output_budget, precheck, retry_transient
+from util import atomic_write, cache_report
+
+# Completed responses are kept here between runs
+CACHE_DIR = ".cache"
+
+def cache_key(**kwargs):
+    """Hash the full request parameters into a stable cache key"""
+    # orjson serializes the multi-KB prompts straight to bytes
+    payload = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+    return hashlib.md5(payload).hexdigest()
+
+def _cache_path(key):
+    return os.path.join(CACHE_DIR, f"{key}.txt")
+
+def lookup(key):
+    """Return the cached response text, or None on a miss"""
+    path = _cache_path(key)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def update(key, text):
+    """Store a completed response under its key"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    atomic_write(_cache_path(key), text)
+
+def _prepare(kwargs):
+    """Pin greedy decoding; sampled responses must never be replayed"""
+    kwargs.setdefault("temperature", 0.0)
+    if kwargs["temperature"] != 0:
+        raise ValueError("Only temperature=0 requests can be cached")
+
+    return cache_key(**kwargs)
+
+def cached_stream(client, **kwargs):
+    """Yield response text, streaming from the API only on a cache miss"""
+    key = _prepare(kwargs)
+
+    text = lookup(key)
+    if text is not None:
+        print("♻️  Loaded from local response cache")
+        yield text
+        return
+
+    # Size the output budget against the real prompt length; cache hits
+    # above never pay for this round-trip
+    input_tokens = precheck(kwargs["system"], kwargs["messages"], kwargs["model"])
+    print(f"📏 {input_tokens} input tokens")
+    kwargs["max_tokens"] = output_budget(input_tokens, kwargs["max_tokens"])
+
+    with client.messages.stream(**kwargs) as stream:
+        yield from stream.text_stream
+        message = stream.get_final_message()
+
+    print(f"\n{cache_report(message.usage)}")
+    update(key, message.content[0].text)
+
+def cached_call(client, **kwargs):
+    """Return response text, calling the API only on a cache miss"""
+    return "".join(cached_stream(client, **kwargs))
+
+@retry_transient
+async def _create(aclient, **kwargs):
+    return await aclient.messages.create(**kwargs)
+
+async def acached_call(aclient, **kwargs):
+    """Async cached_call for the AsyncAnthropic client"""
+    key = _prepare(kwargs)
+
+    text = lookup(key)
+    if text is not None:
+        return text
+
+    input_tokens = await aprecheck(kwargs["system"], kwargs["messages"], kwargs["model"])
+    kwargs["max_tokens"] = output_budget(input_tokens, kwargs["max_tokens"])
+
+    message = await _create(aclient, **kwargs)
+    print(cache_report(message.usage))
+
+    text = message.content[0].text
+    update(key, text)
+    return text
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import sys
+import yaml
+
+from client_factory import get_aclient, get_client, retry_transient
+from llm_cache import acached_call, cached_stream
+from util import atomic_open, atomic_write, cached_system, echo
+
+# Prompts, output ceilings and target documents for every specialist
+AGENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "agents.yaml")
+
+def load_agents(names=None):
+    """Load agent definitions, optionally only the named ones in that order"""
+    with open(AGENTS_FILE, encoding="utf-8") as f:
+        agents = yaml.safe_load(f)
+
+    if not names:
+        return agents
+
+    by_name = {agent["name"]: agent for agent in agents}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise KeyError(f"Unknown agent(s): {', '.join(unknown)}")
+
+    return [by_name[name] for name in names]
+
+def build_params(agent):
+    """Messages API parameters for one agent"""
+    return dict(
+        model="claude-sonnet-4-20250514",
+        max_tokens=agent["max_tokens"],
+        temperature=0.0,
+        top_p=1.0,
+        system=cached_system(agent["system"]),
+        messages=[
+            {"role": "user", "content": agent["user"]}
+        ]
+    )
+
+@retry_transient
+def _stream_to_document(agent):
+    # Identical reruns are served from the local response cache, and the
+    # document is only replaced once the full response has been written,
+    # so a retried attempt starts again from a clean temp file.
+    with atomic_open(agent["output_path"]) as f:
+        f.write(agent["header"])
+        for text in cached_stream(get_client(), **build_params(agent)):
+            echo(text)
+            f.write(text)
+
+def run_agent(name):
+    """Stream one agent to the terminal and its document as text arrives"""
+    agent, = load_agents([name])
+    _stream_to_document(agent)
+
+    print()
+    print(f"\n✅ {agent['name']} saved to {agent['output_path']}")
+
+async def call(agent):
+    """Send one agent's prompt without blocking the others"""
+    return await acached_call(get_aclient(), **build_params(agent))
+
+async def main(agents):
+    """Run agents concurrently, then save their documents"""
+    outputs = await asyncio.gather(*[call(agent) for agent in agents])
+
+    # Save to file once every call has finished
+    for agent, output in zip(agents, outputs):
+        atomic_write(agent["output_path"], agent["header"] + output)
+        print(f"✅ {agent['name']} saved to {agent['output_path']}")
+
+if __name__ == "__main__":
+    # python run_agent.py [name ...]; no names runs the whole team
+    names = sys.argv[1:]
+    if len(names) == 1:
+        run_agent(names[0])
+    else:
+        asyncio.run(main(load_agents(names)))
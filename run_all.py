@@ -0,0 +1,7 @@
+import asyncio
+
+from run_agent import load_agents, main
+
+# Run the whole specialist team concurrently (same as `python run_agent.py`)
+if __name__ == "__main__":
+    asyncio.run(main(load_agents()))
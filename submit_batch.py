@@ -0,0 +1,59 @@
+import time
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
+
+from client_factory import get_client
+from run_agent import build_params, load_agents
+from util import atomic_write, cache_report
+
+# Seconds between batch status checks
+POLL_INTERVAL = 30
+
+def build_requests(agents):
+    """One batch request per agent, keyed by agent name"""
+    return [
+        Request(
+            custom_id=agent["name"],
+            params=MessageCreateParamsNonStreaming(**build_params(agent))
+        )
+        for agent in agents
+    ]
+
+def wait_for_batch(batch_id):
+    """Poll until the batch has finished processing"""
+    client = get_client()
+    batch = client.messages.batches.retrieve(batch_id)
+    while batch.processing_status != "ended":
+        print(f"⏳ Batch {batch_id}: {batch.request_counts.processing} still processing")
+        time.sleep(POLL_INTERVAL)
+        batch = client.messages.batches.retrieve(batch_id)
+
+    return batch
+
+def save_results(batch_id, agents):
+    """Write each succeeded result to its agent's document"""
+    by_name = {agent["name"]: agent for agent in agents}
+
+    for entry in get_client().messages.batches.results(batch_id):
+        agent = by_name[entry.custom_id]
+
+        if entry.result.type != "succeeded":
+            print(f"❌ {entry.custom_id} {entry.result.type}, {agent['output_path']} not updated")
+            continue
+
+        atomic_write(
+            agent["output_path"],
+            agent["header"] + entry.result.message.content[0].text
+        )
+
+        print(f"✅ {entry.custom_id} saved to {agent['output_path']}")
+        print(cache_report(entry.result.message.usage))
+
+if __name__ == "__main__":
+    agents = load_agents()
+
+    batch = get_client().messages.batches.create(requests=build_requests(agents))
+    print(f"📨 Submitted batch {batch.id}")
+
+    wait_for_batch(batch.id)
+    save_results(batch.id, agents)
@@ -1,20 +1,20 @@
-import anthropic
-import os
-from dotenv import load_dotenv
+from client_factory import MAX_TOKENS, get_client, retry_transient
+from util import echo
 
-# Load API key from .env file
-load_dotenv()
+@retry_transient
+def say_hello():
+    """Confirm the API key and connection work"""
+    message = get_client().messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=MAX_TOKENS["test_claude"],
+        temperature=0.0,
+        top_p=1.0,
+        messages=[
+            {"role": "user", "content": "Say hello and confirm you're working!"}
+        ]
+    )
 
-client = anthropic.Anthropic(
-    api_key=os.environ.get("ANTHROPIC_API_KEY")
-)
+    return message.content[0].text
 
-message = client.messages.create(
-    model="claude-sonnet-4-20250514",
-    max_tokens=1024,
-    messages=[
-        {"role": "user", "content": "Say hello and confirm you're working!"}
-    ]
-)
-
-print(message.content[0].text)
\ No newline at end of file
+if __name__ == "__main__":
+    echo(say_hello() + "\n")
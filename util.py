@@ -0,0 +1,48 @@
+import os
+import sys
+from contextlib import contextmanager
+
+# Write buffer for generated documents; large enough for a full response
+WRITE_BUFFER = 1 << 16
+
+def cached_system(text):
+    """Wrap a static system prompt as a prompt-cached content block"""
+    return [
+        {
+            "type": "text",
+            "text": text,
+            "cache_control": {"type": "ephemeral"}
+        }
+    ]
+
+def echo(text):
+    """Write text to stdout's byte buffer, encoding it exactly once"""
+    # Flush pending print() output first so ordering is preserved
+    sys.stdout.flush()
+    sys.stdout.buffer.write(text.encode("utf-8"))
+    sys.stdout.buffer.flush()
+
+def cache_report(usage):
+    """Summarize prompt cache activity for one response"""
+    return (
+        f"🗄️  Prompt cache: {usage.cache_read_input_tokens or 0} tokens read, "
+        f"{usage.cache_creation_input_tokens or 0} tokens written"
+    )
+
+@contextmanager
+def atomic_open(path):
+    """Write to a temp file that replaces path only once writing succeeds"""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=WRITE_BUFFER) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def atomic_write(path, content):
+    """Replace path with content in a single atomic publish"""
+    with atomic_open(path) as f:
+        f.write(content)